@@ -4,7 +4,8 @@ herd-notify-slack — Herd notification adapter for Slack.
 Part of The Herd ecosystem: https://github.com/herd-ag/herd-core
 """
 
-from herd_notify_slack.adapter import SlackNotifyAdapter
+from herd_notify_slack.adapter import PostManyError, SlackNotifyAdapter
+from herd_notify_slack.async_adapter import AsyncSlackNotifyAdapter
 
 __version__ = "0.0.1"
-__all__ = ["SlackNotifyAdapter"]
+__all__ = ["AsyncSlackNotifyAdapter", "PostManyError", "SlackNotifyAdapter"]
@@ -0,0 +1,450 @@
+"""Helpers shared by the sync and async Slack adapters.
+
+Encoding, response conversion, rate limiting, retries and search paging
+live here so that both adapters behave the same way.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import random
+import threading
+import time
+import urllib.parse
+from collections import OrderedDict
+from collections.abc import Iterable
+from datetime import datetime
+from functools import lru_cache
+from typing import Any
+
+from herd_core.types import PostResult, ThreadMessage
+
+from herd_notify_slack._parse import parse_matches, parse_replies
+
+# httpx only negotiates HTTP/2 when h2 is installed.
+HAS_H2 = importlib.util.find_spec("h2") is not None
+
+try:
+    import orjson
+
+    dumps = orjson.dumps
+    loads = orjson.loads
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+    def dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    loads = json.loads
+
+
+API_URL = "https://slack.com/api/"
+
+# Endpoint URLs for the methods we call, built once.
+METHOD_URLS = {
+    method: f"{API_URL}{method}"
+    for method in ("chat.postMessage", "conversations.replies", "search.messages")
+}
+
+# Slack's published rate limits for the methods we call, as
+# (requests per minute, burst size). Unlisted methods get Tier 3.
+# chat.postMessage is limited per channel, so it gets a bucket per channel.
+_RATE_LIMITS: dict[str, tuple[float, float]] = {
+    "chat.postMessage": (60, 10),  # ~1 per second per channel
+    "conversations.replies": (50, 10),  # Tier 3
+    "search.messages": (20, 5),  # Tier 2
+}
+_DEFAULT_RATE_LIMIT = (50, 10)
+
+# Transient statuses worth retrying, and the exponential backoff schedule.
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_BACKOFF_BASE = 0.5
+_BACKOFF_CAP = 30.0
+
+
+class HTTPStatusError(RuntimeError):
+    """HTTP error status from Slack, with the Retry-After hint if any."""
+
+    def __init__(self, status: int, reason: str, retry_after: float | None = None):
+        super().__init__(f"HTTP error: {status} {reason}")
+        self.status = status
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given in seconds."""
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+
+def backoff_delay(attempt: int, retry_after: float | None = None) -> float:
+    """Seconds to wait before retry ``attempt`` (0-based).
+
+    Honors Slack's Retry-After when given, otherwise exponential backoff
+    with full jitter.
+    """
+    if retry_after is not None:
+        return retry_after
+    return random.random() * min(_BACKOFF_CAP, _BACKOFF_BASE * 2**attempt)
+
+
+class TokenBucket:
+    """Adaptive client-side token bucket for one Slack API method.
+
+    Tokens refill at ``rate`` per second up to ``capacity``. The rate backs
+    off multiplicatively when Slack answers 429 and recovers additively on
+    success, never exceeding the published limit (AIMD).
+    """
+
+    # Multiplicative decrease on 429; additive increase per success as a
+    # fraction of the published limit.
+    BETA = 0.5
+    ALPHA = 0.05
+    MIN_RATE_FACTOR = 0.05
+
+    def __init__(self, rate: float, capacity: float):
+        self.max_rate = rate
+        self.min_rate = rate * self.MIN_RATE_FACTOR
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_method(cls, method: str) -> TokenBucket:
+        """Create a bucket sized to the method's published Slack limit."""
+        per_minute, burst = _RATE_LIMITS.get(method, _DEFAULT_RATE_LIMIT)
+        return cls(per_minute / 60, burst)
+
+    def reserve(self) -> float:
+        """Take a token and return how long to wait before using it.
+
+        Tokens may go negative, so concurrent callers queue up behind each
+        other instead of all waking at once.
+        """
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self.last_refill
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.last_refill = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            return max(wait, self.blocked_until - now)
+
+    def acquire(self) -> None:
+        """Block until a token is available."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    def on_success(self) -> None:
+        """Additively raise the rate back toward the published limit."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate * self.ALPHA)
+
+    def on_rate_limited(self, retry_after: float | None = None) -> None:
+        """Halve the rate and hold off until Slack's Retry-After passes."""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate * self.BETA)
+            self.tokens = min(self.tokens, 0.0)
+            if retry_after is not None:
+                self.blocked_until = max(
+                    self.blocked_until, time.monotonic() + retry_after
+                )
+
+
+class TokenBuckets:
+    """Thread-safe LRU map of token buckets, one per method and channel.
+
+    Posting bots may reach many channels and DMs over their lifetime, so
+    the least recently used buckets are dropped past ``maxsize``.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._buckets: OrderedDict[tuple[str, str | None], TokenBucket] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key: tuple[str, str | None]) -> TokenBucket:
+        return self._buckets[key]
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def bucket(self, method: str, channel: str | None = None) -> TokenBucket:
+        """Return the bucket for an API method, creating it on first use.
+
+        ``channel`` selects a separate bucket for per-channel limits.
+        """
+        key = (method, channel)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket.for_method(method)
+                while len(self._buckets) > self.maxsize:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(key)
+            return bucket
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after ``ttl`` seconds."""
+
+    def __init__(self, ttl: float, maxsize: int = 256):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any | None:
+        """Return the cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if time.monotonic() - stored_at >= self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Any, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, key: Any) -> None:
+        """Drop a cached value if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+# chat.postMessage bodies only come in a few fixed shapes. With stdlib
+# json they are filled into pre-built templates, with only the values
+# going through dumps for string escaping. orjson encodes the whole dict
+# faster than it encodes each value separately, so with orjson the dict
+# is encoded directly.
+_MESSAGE_TEMPLATE = b'{"channel":%s,"text":%s}'
+_MESSAGE_USERNAME_TEMPLATE = b'{"channel":%s,"text":%s,"username":%s}'
+_MESSAGE_ICON_TEMPLATE = b'{"channel":%s,"text":%s,"icon_emoji":%s}'
+_MESSAGE_USERNAME_ICON_TEMPLATE = (
+    b'{"channel":%s,"text":%s,"username":%s,"icon_emoji":%s}'
+)
+_THREAD_REPLY_TEMPLATE = b'{"channel":%s,"text":%s,"thread_ts":%s}'
+
+
+def encode_message_template(
+    channel: str,
+    message: str,
+    *,
+    username: str | None = None,
+    icon: str | None = None,
+) -> bytes:
+    """Encode a chat.postMessage body for a channel post from a template."""
+    if username:
+        if icon:
+            return _MESSAGE_USERNAME_ICON_TEMPLATE % (
+                dumps(channel),
+                dumps(message),
+                dumps(username),
+                dumps(icon),
+            )
+        return _MESSAGE_USERNAME_TEMPLATE % (
+            dumps(channel),
+            dumps(message),
+            dumps(username),
+        )
+    if icon:
+        return _MESSAGE_ICON_TEMPLATE % (dumps(channel), dumps(message), dumps(icon))
+    return _MESSAGE_TEMPLATE % (dumps(channel), dumps(message))
+
+
+def encode_thread_reply_template(
+    channel: str, message: str, thread_ts: str
+) -> bytes:
+    """Encode a chat.postMessage body for a thread reply from a template."""
+    return _THREAD_REPLY_TEMPLATE % (
+        dumps(channel),
+        dumps(message),
+        dumps(thread_ts),
+    )
+
+
+def encode_message_dict(
+    channel: str,
+    message: str,
+    *,
+    username: str | None = None,
+    icon: str | None = None,
+) -> bytes:
+    """Encode a chat.postMessage body for a channel post as a dict."""
+    payload = {"channel": channel, "text": message}
+    if username:
+        payload["username"] = username
+    if icon:
+        payload["icon_emoji"] = icon
+    return dumps(payload)
+
+
+def encode_thread_reply_dict(channel: str, message: str, thread_ts: str) -> bytes:
+    """Encode a chat.postMessage body for a thread reply as a dict."""
+    return dumps({"channel": channel, "text": message, "thread_ts": thread_ts})
+
+
+if orjson is not None:
+    encode_message = encode_message_dict
+    encode_thread_reply = encode_thread_reply_dict
+else:  # pragma: no cover - optional dependency
+    encode_message = encode_message_template
+    encode_thread_reply = encode_thread_reply_template
+
+
+def post_result(result: dict[str, Any]) -> PostResult:
+    """Convert a chat.postMessage response into a PostResult.
+
+    Raises:
+        RuntimeError: If Slack reported an API error.
+    """
+    if not result.get("ok"):
+        error = result.get("error", "unknown error")
+        raise RuntimeError(f"Slack API error: {error}")
+
+    return PostResult(
+        message_id=result["ts"],
+        channel=result["channel"],
+        timestamp=result["ts"],
+    )
+
+
+def thread_replies(result: dict[str, Any]) -> list[ThreadMessage]:
+    """Extract replies from a conversations.replies response."""
+    if not result.get("ok"):
+        return []
+
+    return parse_replies(result.get("messages", []))
+
+
+def cached_thread_replies(
+    cache: TTLCache | None, channel: str, thread_id: str
+) -> list[ThreadMessage] | None:
+    """Return the cached replies of a thread, or None if not cached."""
+    if cache is None:
+        return None
+    cached = cache.get((channel, thread_id))
+    return list(cached) if cached is not None else None
+
+
+def cache_thread_replies(
+    cache: TTLCache | None, channel: str, thread_id: str, result: dict[str, Any]
+) -> list[ThreadMessage]:
+    """Extract replies from a conversations.replies response and cache them.
+
+    Only successful responses are cached.
+    """
+    replies = thread_replies(result)
+    if cache is not None and result.get("ok"):
+        cache.put((channel, thread_id), tuple(replies))
+    return replies
+
+
+# search.messages returns at most 100 matches per page.
+_SEARCH_PAGE_SIZE = 100
+
+
+@lru_cache(maxsize=256)
+def search_url(
+    query: str, channel: str | None, date_str: str | None, count: int, page: int
+) -> str:
+    """Build the search.messages URL for one page of a query.
+
+    Memoized: polling bots repeat the same search every cycle, so the
+    filter string and query encoding are only built once.
+    """
+    search_query = query
+    if channel:
+        search_query = f"{query} in:{channel}"
+    if date_str:
+        search_query = f"{search_query} after:{date_str}"
+
+    params = urllib.parse.urlencode(
+        {"query": search_query, "count": count, "page": page}
+    )
+    return f"{METHOD_URLS['search.messages']}?{params}"
+
+
+def search_urls(
+    query: str,
+    channel: str | None,
+    since: datetime | None,
+    limit: int,
+    pages: Iterable[int],
+) -> list[str]:
+    """Build the URLs of the given search.messages pages for ``limit``."""
+    # Slack uses YYYY-MM-DD format for date filters
+    date_str = since.strftime("%Y-%m-%d") if since else None
+    count = min(limit, _SEARCH_PAGE_SIZE)
+
+    return [search_url(query, channel, date_str, count, page) for page in pages]
+
+
+def more_search_pages(first: dict[str, Any] | None, limit: int) -> range:
+    """Pages after the first still needed for ``limit``.
+
+    Only pages the first page's paging info says exist are requested, so
+    small result sets cost one call however large ``limit`` is. Missing or
+    malformed paging info means no more pages.
+    """
+    if not first or not first.get("ok"):
+        return range(0)
+
+    messages = first.get("messages", {})
+    count = min(limit, _SEARCH_PAGE_SIZE)
+    if len(messages.get("matches", [])) < count:
+        return range(0)
+
+    paging = messages.get("paging")
+    if not isinstance(paging, dict):
+        return range(0)
+    pages, total = paging.get("pages"), paging.get("total")
+    if isinstance(pages, int) and pages > 0:
+        available = pages
+    elif isinstance(total, int):
+        available = -(-total // count)
+    else:
+        return range(0)
+    wanted = -(-limit // count)
+
+    return range(2, min(wanted, available) + 1)
+
+
+def search_matches(
+    results: list[dict[str, Any] | None], limit: int
+) -> list[ThreadMessage]:
+    """Merge up to ``limit`` matches from search.messages pages, in order.
+
+    Stops at the first failed (None) or empty page.
+    """
+    matches: list[dict[str, Any]] = []
+    for result in results:
+        if not result or not result.get("ok"):
+            break
+        page = result.get("messages", {}).get("matches", [])
+        if not page:
+            break
+        matches.extend(page)
+
+    return parse_matches(matches, limit)
+
+
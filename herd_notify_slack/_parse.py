@@ -0,0 +1,41 @@
+"""Message parsing for Slack API responses.
+
+Kept free of I/O and fully annotated so it can be compiled with mypyc
+(see ``HATCH_BUILD_HOOK_ENABLE_MYPYC`` in pyproject.toml). The pure-Python
+module is used whenever no compiled build is installed. The gain is
+modest: ``ThreadMessage`` comes from uncompiled herd-core, so building
+each one is still a regular Python call.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from herd_core.types import ThreadMessage
+
+
+def parse_replies(messages: list[dict[str, Any]]) -> list[ThreadMessage]:
+    """Convert conversations.replies messages, skipping the parent message."""
+    # Positional (author, text, timestamp): cheaper than keyword dispatch
+    # when building large reply lists.
+    return [
+        ThreadMessage(
+            msg.get("user", "unknown"),
+            msg.get("text", ""),
+            msg.get("ts", ""),
+        )
+        for msg in messages[1:]
+    ]
+
+
+def parse_matches(matches: list[dict[str, Any]], limit: int) -> list[ThreadMessage]:
+    """Convert up to ``limit`` search.messages matches."""
+    # Most matches carry "user", so the "username" lookup rarely runs
+    return [
+        ThreadMessage(
+            msg.get("user") or msg.get("username") or "unknown",
+            msg.get("text", ""),
+            msg.get("ts", ""),
+        )
+        for msg in matches[:limit]
+    ]
@@ -2,28 +2,181 @@
 
 from __future__ import annotations
 
-import json
+import time
+import urllib.error
 import urllib.parse
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any
 
 from herd_core.types import PostResult, ThreadMessage
 
+from herd_notify_slack._common import (
+    API_URL,
+    HAS_H2,
+    METHOD_URLS,
+    RETRY_STATUSES,
+    HTTPStatusError,
+    TokenBuckets,
+    TTLCache,
+    backoff_delay,
+    cache_thread_replies,
+    cached_thread_replies,
+    dumps,
+    encode_message,
+    encode_thread_reply,
+    loads,
+    more_search_pages,
+    parse_retry_after,
+    post_result,
+    search_matches,
+    search_urls,
+)
+
+try:
+    import urllib3
+except ImportError:  # pragma: no cover - optional dependency
+    urllib3 = None  # type: ignore[assignment]
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None  # type: ignore[assignment]
+
+# One pool for the process: every adapter talks to the same host, so
+# instances (e.g., one per tenant) share kept-alive TLS connections.
+# Credentials are sent per request, never stored on the pool.
+# urllib3 still retries dropped connections, but must not retry 429/503
+# on Retry-After itself: statuses go through the adapter's retry loop and
+# rate limiter.
+_SHARED_POOL = (
+    urllib3.PoolManager(
+        num_pools=1,
+        maxsize=32,
+        block=False,
+        retries=urllib3.Retry(3, respect_retry_after_header=False),
+    )
+    if urllib3 is not None
+    else None
+)
+
+
+class PostManyError(RuntimeError):
+    """Raised by ``post_many`` when some of its posts fail.
+
+    Every post is attempted; the error reports what was delivered.
+
+    Attributes:
+        results: PostResult for each message, in the order given, or None
+            where the post failed.
+        errors: The error for each failed post, keyed by message index.
+    """
+
+    def __init__(
+        self, results: list[PostResult | None], errors: dict[int, Exception]
+    ):
+        first = next(iter(errors.values()))
+        super().__init__(f"{len(errors)} of {len(results)} posts failed: {first}")
+        self.results = results
+        self.errors = errors
+
 
 class SlackNotifyAdapter:
     """Slack notification adapter implementing NotifyAdapter protocol.
 
-    Uses stdlib urllib — no external HTTP dependencies.
+    Reuses kept-alive connections to slack.com from a pool shared by all
+    adapters when urllib3 is installed; otherwise falls back to stdlib
+    urllib. With ``http2=True`` calls are multiplexed over HTTP/2 by httpx
+    instead.
 
     Args:
         token: Slack API token (xoxb-...).
         default_channel: Default channel for posts (e.g., "#herd-feed").
+        max_workers: Threads used by ``post_many`` to send posts concurrently.
+        rate_limit: Pace calls client-side to stay under Slack's per-method
+            rate limits (per channel for posts), backing off when Slack
+            answers 429.
+        max_retries: Retries for 429 and 5xx responses, with exponential
+            backoff and jitter (or Slack's Retry-After).
+        thread_cache_ttl: Seconds to reuse ``get_thread_replies`` results
+            for repeated polls of the same thread (e.g., 5). 0 disables.
+        http2: Send calls over HTTP/2 with httpx, so concurrent calls (e.g.,
+            from ``post_many``) share one connection. Requires the ``async``
+            extra.
     """
 
-    def __init__(self, token: str, default_channel: str = "#herd-feed"):
+    __slots__ = (
+        "token",
+        "default_channel",
+        "max_retries",
+        "_headers_auth",
+        "_headers_json",
+        "_http",
+        "_client",
+        "_pool",
+        "_buckets",
+        "_thread_cache",
+        "_closed",
+    )
+
+    def __init__(
+        self,
+        token: str,
+        default_channel: str = "#herd-feed",
+        *,
+        max_workers: int = 8,
+        rate_limit: bool = True,
+        max_retries: int = 3,
+        thread_cache_ttl: float = 0,
+        http2: bool = False,
+    ):
+        if http2 and (httpx is None or not HAS_H2):
+            raise ImportError(
+                "http2=True requires httpx with h2: "
+                'pip install "herd-notify-slack[async]"'
+            )
+
         self.token = token
         self.default_channel = default_channel
+        self.max_retries = max_retries
+        self._headers_auth = {"Authorization": f"Bearer {token}"}
+        self._headers_json = {
+            **self._headers_auth,
+            "Content-Type": "application/json",
+        }
+        self._http = _SHARED_POOL
+        self._client = (
+            httpx.Client(http2=True, limits=httpx.Limits(max_connections=4))
+            if http2
+            else None
+        )
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="herd-notify-slack"
+        )
+        self._buckets = TokenBuckets() if rate_limit else None
+        self._thread_cache = (
+            TTLCache(thread_cache_ttl) if thread_cache_ttl > 0 else None
+        )
+        self._closed = False
+
+    def __enter__(self) -> SlackNotifyAdapter:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker threads and the HTTP/2 client, if any.
+
+        Connections in the pool shared with other adapters stay open.
+        Afterwards ``post_many`` raises, and ``search`` fetches its result
+        pages one at a time on the calling thread.
+        """
+        self._closed = True
+        self._pool.shutdown(wait=True)
+        if self._client is not None:
+            self._client.close()
 
     def post(
         self,
@@ -49,27 +202,9 @@ class SlackNotifyAdapter:
         """
         channel = channel or self.default_channel
 
-        payload: dict[str, Any] = {
-            "channel": channel,
-            "text": message,
-        }
-
-        if username:
-            payload["username"] = username
-        if icon:
-            payload["icon_emoji"] = icon
-
-        result = self._api_call("chat.postMessage", payload)
+        body = encode_message(channel, message, username=username, icon=icon)
 
-        if not result.get("ok"):
-            error = result.get("error", "unknown error")
-            raise RuntimeError(f"Slack API error: {error}")
-
-        return PostResult(
-            message_id=result["ts"],
-            channel=result["channel"],
-            timestamp=result["ts"],
-        )
+        return self._post_message(body, channel)
 
     def post_thread(
         self,
@@ -93,23 +228,70 @@ class SlackNotifyAdapter:
         """
         channel = channel or self.default_channel
 
-        payload = {
-            "channel": channel,
-            "text": message,
-            "thread_ts": thread_id,
-        }
+        body = encode_thread_reply(channel, message, thread_id)
+        result = self._post_message(body, channel)
 
-        result = self._api_call("chat.postMessage", payload)
+        # Our own reply should show up on the next poll of this thread
+        if self._thread_cache is not None:
+            self._thread_cache.discard((channel, thread_id))
 
-        if not result.get("ok"):
-            error = result.get("error", "unknown error")
-            raise RuntimeError(f"Slack API error: {error}")
+        return result
 
-        return PostResult(
-            message_id=result["ts"],
-            channel=result["channel"],
-            timestamp=result["ts"],
-        )
+    def post_many(
+        self,
+        messages: list[str],
+        *,
+        channel: str | None = None,
+        username: str | None = None,
+        icon: str | None = None,
+    ) -> list[PostResult]:
+        """Post several messages concurrently.
+
+        Each message is sent as its own chat.postMessage call on the worker
+        threads, sharing the pooled connections. With ``rate_limit`` on,
+        Slack's limit of about one post per second per channel still
+        applies past a burst of 10.
+
+        Args:
+            messages: Message contents.
+            channel: Target channel. Defaults to the primary feed channel.
+            username: Display name for these posts.
+            icon: Emoji icon for these posts (e.g., ":hammer:").
+
+        Returns:
+            PostResult for each message, in the order given.
+
+        Raises:
+            PostManyError: If any post fails, once all posts have been
+                attempted. Its ``results`` hold the posts that went through.
+            RuntimeError: If the adapter has been closed.
+        """
+        if self._closed:
+            raise RuntimeError("SlackNotifyAdapter is closed")
+
+        channel = channel or self.default_channel
+
+        futures = [
+            self._pool.submit(
+                self._post_message,
+                encode_message(channel, message, username=username, icon=icon),
+                channel,
+            )
+            for message in messages
+        ]
+
+        results: list[PostResult | None] = []
+        errors: dict[int, Exception] = {}
+        for index, future in enumerate(futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(None)
+                errors[index] = e
+
+        if errors:
+            raise PostManyError(results, errors)
+        return results  # type: ignore[return-value]
 
     def get_thread_replies(
         self,
@@ -125,33 +307,16 @@ class SlackNotifyAdapter:
         Returns:
             List of thread replies, or empty list if not found.
         """
-        params = urllib.parse.urlencode({"channel": channel, "ts": thread_id})
-        url = f"https://slack.com/api/conversations.replies?{params}"
+        cached = cached_thread_replies(self._thread_cache, channel, thread_id)
+        if cached is not None:
+            return cached
 
         try:
-            req = urllib.request.Request(
-                url,
-                headers={"Authorization": f"Bearer {self.token}"},
+            result = self._api_get(
+                "conversations.replies", {"channel": channel, "ts": thread_id}
             )
 
-            with urllib.request.urlopen(req) as resp:
-                result = json.loads(resp.read())
-
-            if not result.get("ok"):
-                return []
-
-            messages = result.get("messages", [])
-            # Filter out parent message (first message)
-            replies = messages[1:] if len(messages) > 1 else []
-
-            return [
-                ThreadMessage(
-                    author=msg.get("user", "unknown"),
-                    text=msg.get("text", ""),
-                    timestamp=msg.get("ts", ""),
-                )
-                for msg in replies
-            ]
+            return cache_thread_replies(self._thread_cache, channel, thread_id, result)
         except Exception:
             return []
 
@@ -169,56 +334,83 @@ class SlackNotifyAdapter:
             query: Search query string.
             channel: Restrict to a specific channel.
             since: Only messages after this timestamp.
-            limit: Maximum results to return.
+            limit: Maximum results to return. Limits above 100 span
+                several result pages; after the first, the remaining pages
+                Slack reports are fetched concurrently.
 
         Returns:
             Matching messages, most recent first.
         """
-        # Build search query with filters
-        search_query = query
-        if channel:
-            search_query = f"{query} in:{channel}"
-        if since:
-            # Slack uses YYYY-MM-DD format for date filters
-            date_str = since.strftime("%Y-%m-%d")
-            search_query = f"{search_query} after:{date_str}"
-
-        params = urllib.parse.urlencode(
-            {"query": search_query, "count": min(limit, 100)}
-        )
-        url = f"https://slack.com/api/search.messages?{params}"
+        if limit <= 0:
+            return []
 
         try:
-            req = urllib.request.Request(
-                url,
-                headers={"Authorization": f"Bearer {self.token}"},
-            )
-
-            with urllib.request.urlopen(req) as resp:
-                result = json.loads(resp.read())
+            (url,) = search_urls(query, channel, since, limit, [1])
+            first = self._search_page(url)
+
+            pages = more_search_pages(first, limit)
+            urls = search_urls(query, channel, since, limit, pages)
+            if self._closed:
+                # No worker threads after close(); fetch the rest here.
+                results = [first, *map(self._search_page, urls)]
+            else:
+                futures = [self._pool.submit(self._search_page, url) for url in urls]
+                results = [first, *(future.result() for future in futures)]
+
+            return search_matches(results, limit)
+        except Exception:
+            return []
 
-            if not result.get("ok"):
-                return []
+    def _search_page(self, url: str) -> dict[str, Any] | None:
+        """Fetch one search.messages page, or None on failure."""
+        try:
+            return self._request(
+                "GET", "search.messages", url=url, headers=self._headers_auth
+            )
+        except Exception:
+            return None
 
-            matches = result.get("messages", {}).get("matches", [])
+    def _post_message(self, body: bytes, channel: str) -> PostResult:
+        """Send an encoded chat.postMessage body and convert the response.
 
-            return [
-                ThreadMessage(
-                    author=msg.get("user", msg.get("username", "unknown")),
-                    text=msg.get("text", ""),
-                    timestamp=msg.get("ts", ""),
-                )
-                for msg in matches[:limit]
-            ]
-        except Exception:
-            return []
+        Raises:
+            RuntimeError: On authentication failure or API error.
+        """
+        return post_result(self._api_call("chat.postMessage", body, channel=channel))
 
-    def _api_call(self, method: str, payload: dict[str, Any]) -> dict[str, Any]:
+    def _api_call(
+        self,
+        method: str,
+        payload: dict[str, Any] | bytes,
+        *,
+        channel: str | None = None,
+    ) -> dict[str, Any]:
         """Make a Slack API call.
 
         Args:
             method: API method (e.g., "chat.postMessage").
-            payload: JSON payload.
+            payload: JSON payload, or its already encoded bytes.
+            channel: Channel whose rate-limit bucket the call counts
+                against, for per-channel methods.
+
+        Returns:
+            API response as dict.
+
+        Raises:
+            RuntimeError: On HTTP error.
+        """
+        body = payload if isinstance(payload, bytes) else dumps(payload)
+
+        return self._request(
+            "POST", method, body=body, headers=self._headers_json, channel=channel
+        )
+
+    def _api_get(self, method: str, params: dict[str, Any]) -> dict[str, Any]:
+        """Make a Slack API GET call with query parameters.
+
+        Args:
+            method: API method (e.g., "conversations.replies").
+            params: Query parameters.
 
         Returns:
             API response as dict.
@@ -226,22 +418,156 @@ class SlackNotifyAdapter:
         Raises:
             RuntimeError: On HTTP error.
         """
-        url = f"https://slack.com/api/{method}"
-        data = json.dumps(payload).encode()
+        return self._request("GET", method, fields=params, headers=self._headers_auth)
 
+    def _request(
+        self,
+        http_method: str,
+        method: str,
+        *,
+        url: str | None = None,
+        body: bytes | None = None,
+        fields: dict[str, Any] | None = None,
+        headers: dict[str, str],
+        channel: str | None = None,
+    ) -> dict[str, Any]:
+        """Send a rate-limited request and decode the JSON reply.
+
+        ``url`` overrides the method's endpoint, e.g. for a prebuilt query.
+
+        Uses the HTTP/2 client when enabled, else the connection pool, or
+        stdlib urllib (one connection per call) when urllib3 is not
+        installed. 429 and 5xx responses are retried up
+        to ``max_retries`` times.
+
+        Raises:
+            RuntimeError: On HTTP error or network failure.
+        """
+        url = url or METHOD_URLS.get(method) or f"{API_URL}{method}"
+        buckets = self._buckets
+        bucket = buckets.bucket(method, channel) if buckets is not None else None
+        if self._client is not None:
+            send = self._httpx_request
+        elif self._http is not None:
+            send = self._pool_request
+        else:
+            send = self._urllib_request
+
+        attempt = 0
+        while True:
+            if bucket is not None:
+                bucket.acquire()
+
+            try:
+                result = send(
+                    http_method, url, body=body, fields=fields, headers=headers
+                )
+            except HTTPStatusError as e:
+                if bucket is not None and e.status == 429:
+                    bucket.on_rate_limited(e.retry_after)
+                if e.status not in RETRY_STATUSES or attempt >= self.max_retries:
+                    raise
+                time.sleep(backoff_delay(attempt, e.retry_after))
+                attempt += 1
+                continue
+
+            if bucket is not None:
+                bucket.on_success()
+            return result
+
+    def _httpx_request(
+        self,
+        http_method: str,
+        url: str,
+        *,
+        body: bytes | None = None,
+        fields: dict[str, Any] | None = None,
+        headers: dict[str, str],
+    ) -> dict[str, Any]:
+        """Send a request over the multiplexed HTTP/2 client."""
+        try:
+            resp = self._client.request(
+                http_method, url, content=body, params=fields, headers=headers
+            )
+        except Exception as e:
+            raise RuntimeError(f"Request failed: {e}")
+
+        if resp.status_code >= 400:
+            raise HTTPStatusError(
+                resp.status_code,
+                resp.reason_phrase,
+                parse_retry_after(resp.headers.get("Retry-After")),
+            )
+
+        try:
+            return loads(resp.content)
+        except Exception as e:
+            raise RuntimeError(f"Request failed: {e}")
+
+    def _pool_request(
+        self,
+        http_method: str,
+        url: str,
+        *,
+        body: bytes | None = None,
+        fields: dict[str, Any] | None = None,
+        headers: dict[str, str],
+    ) -> dict[str, Any]:
+        """Send a request through the urllib3 connection pool.
+
+        GET ``fields`` are encoded into the query string by urllib3.
+        """
+        try:
+            resp = self._http.request(
+                http_method,
+                url,
+                body=body,
+                fields=fields,
+                headers=headers,
+                preload_content=False,
+            )
+        except Exception as e:
+            raise RuntimeError(f"Request failed: {e}")
+
+        try:
+            if resp.status >= 400:
+                resp.drain_conn()
+                raise HTTPStatusError(
+                    resp.status,
+                    resp.reason,
+                    parse_retry_after(resp.headers.get("Retry-After")),
+                )
+
+            try:
+                return loads(resp.read())
+            except Exception as e:
+                raise RuntimeError(f"Request failed: {e}")
+        finally:
+            resp.release_conn()
+
+    def _urllib_request(
+        self,
+        http_method: str,
+        url: str,
+        *,
+        body: bytes | None = None,
+        fields: dict[str, Any] | None = None,
+        headers: dict[str, str],
+    ) -> dict[str, Any]:
+        """Send a request with stdlib urllib (no connection reuse)."""
+        if fields:
+            url = f"{url}?{urllib.parse.urlencode(fields)}"
         req = urllib.request.Request(
-            url,
-            data=data,
-            headers={
-                "Authorization": f"Bearer {self.token}",
-                "Content-Type": "application/json",
-            },
+            url, data=body, headers=headers, method=http_method
         )
 
         try:
             with urllib.request.urlopen(req) as resp:
-                return json.loads(resp.read())
+                return loads(resp.read())
         except urllib.error.HTTPError as e:
-            raise RuntimeError(f"HTTP error: {e.code} {e.reason}")
+            headers = e.headers or {}
+            raise HTTPStatusError(
+                e.code, e.reason, parse_retry_after(headers.get("Retry-After"))
+            )
         except Exception as e:
             raise RuntimeError(f"Request failed: {e}")
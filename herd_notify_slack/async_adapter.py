@@ -0,0 +1,351 @@
+"""Async Slack notification adapter built on httpx."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from typing import Any
+
+from herd_core.types import PostResult, ThreadMessage
+
+from herd_notify_slack._common import (
+    API_URL,
+    HAS_H2,
+    RETRY_STATUSES,
+    HTTPStatusError,
+    TokenBuckets,
+    TTLCache,
+    backoff_delay,
+    cache_thread_replies,
+    cached_thread_replies,
+    dumps,
+    encode_message,
+    encode_thread_reply,
+    loads,
+    more_search_pages,
+    parse_retry_after,
+    post_result,
+    search_matches,
+    search_urls,
+)
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None  # type: ignore[assignment]
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+class AsyncSlackNotifyAdapter:
+    """Async counterpart of SlackNotifyAdapter.
+
+    Mirrors the NotifyAdapter methods as coroutines over a pooled
+    ``httpx.AsyncClient``, so concurrent calls share connections (and a
+    single HTTP/2 connection when ``h2`` is installed)::
+
+        async with AsyncSlackNotifyAdapter(token="xoxb-...") as adapter:
+            results = await asyncio.gather(
+                *(adapter.post(m, channel=c) for m, c in messages)
+            )
+
+    Requires the ``async`` extra: ``pip install "herd-notify-slack[async]"``.
+
+    Args:
+        token: Slack API token (xoxb-...).
+        default_channel: Default channel for posts (e.g., "#herd-feed").
+        http2: Negotiate HTTP/2 with slack.com. Falls back to HTTP/1.1
+            when ``h2`` is not installed (the ``async`` extra includes it).
+        rate_limit: Pace calls client-side to stay under Slack's per-method
+            rate limits (per channel for posts), backing off when Slack
+            answers 429.
+        max_retries: Retries for 429 and 5xx responses, with exponential
+            backoff and jitter (or Slack's Retry-After).
+        thread_cache_ttl: Seconds to reuse ``get_thread_replies`` results
+            for repeated polls of the same thread (e.g., 5). 0 disables.
+    """
+
+    __slots__ = (
+        "token",
+        "default_channel",
+        "max_retries",
+        "_client",
+        "_buckets",
+        "_thread_cache",
+    )
+
+    def __init__(
+        self,
+        token: str,
+        default_channel: str = "#herd-feed",
+        *,
+        http2: bool = True,
+        rate_limit: bool = True,
+        max_retries: int = 3,
+        thread_cache_ttl: float = 0,
+    ):
+        if httpx is None:
+            raise ImportError(
+                "AsyncSlackNotifyAdapter requires httpx: "
+                'pip install "herd-notify-slack[async]"'
+            )
+
+        self.token = token
+        self.default_channel = default_channel
+        self.max_retries = max_retries
+        self._client = httpx.AsyncClient(
+            base_url=API_URL,
+            http2=http2 and HAS_H2,
+            headers={"Authorization": f"Bearer {token}"},
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
+        self._buckets = TokenBuckets() if rate_limit else None
+        self._thread_cache = (
+            TTLCache(thread_cache_ttl) if thread_cache_ttl > 0 else None
+        )
+
+    async def __aenter__(self) -> AsyncSlackNotifyAdapter:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        await self._client.aclose()
+
+    async def post(
+        self,
+        message: str,
+        *,
+        channel: str | None = None,
+        username: str | None = None,
+        icon: str | None = None,
+    ) -> PostResult:
+        """Post a message to a channel.
+
+        Args:
+            message: Message content.
+            channel: Target channel. Defaults to the primary feed channel.
+            username: Display name for this post.
+            icon: Emoji icon for this post (e.g., ":hammer:").
+
+        Returns:
+            PostResult with message_id and timestamp.
+
+        Raises:
+            RuntimeError: On authentication failure or API error.
+        """
+        channel = channel or self.default_channel
+
+        body = encode_message(channel, message, username=username, icon=icon)
+
+        return await self._post_message(body, channel)
+
+    async def post_thread(
+        self,
+        thread_id: str,
+        message: str,
+        *,
+        channel: str | None = None,
+    ) -> PostResult:
+        """Reply to an existing thread.
+
+        Args:
+            thread_id: Parent message timestamp (ts).
+            message: Reply content.
+            channel: Target channel (required if not default).
+
+        Returns:
+            PostResult with message_id and timestamp.
+
+        Raises:
+            RuntimeError: On authentication failure or API error.
+        """
+        channel = channel or self.default_channel
+
+        body = encode_thread_reply(channel, message, thread_id)
+        result = await self._post_message(body, channel)
+
+        # Our own reply should show up on the next poll of this thread
+        if self._thread_cache is not None:
+            self._thread_cache.discard((channel, thread_id))
+
+        return result
+
+    async def get_thread_replies(
+        self,
+        channel: str,
+        thread_id: str,
+    ) -> list[ThreadMessage]:
+        """Fetch all replies in a thread (excluding the parent message).
+
+        Args:
+            channel: Channel containing the thread.
+            thread_id: Parent message timestamp (ts).
+
+        Returns:
+            List of thread replies, or empty list if not found.
+        """
+        cached = cached_thread_replies(self._thread_cache, channel, thread_id)
+        if cached is not None:
+            return cached
+
+        try:
+            result = await self._api_get(
+                "conversations.replies", {"channel": channel, "ts": thread_id}
+            )
+
+            return cache_thread_replies(self._thread_cache, channel, thread_id, result)
+        except Exception:
+            return []
+
+    async def search(
+        self,
+        query: str,
+        *,
+        channel: str | None = None,
+        since: datetime | None = None,
+        limit: int = 50,
+    ) -> list[ThreadMessage]:
+        """Search messages in a channel.
+
+        Args:
+            query: Search query string.
+            channel: Restrict to a specific channel.
+            since: Only messages after this timestamp.
+            limit: Maximum results to return. Limits above 100 span
+                several result pages; after the first, the remaining pages
+                Slack reports are fetched concurrently.
+
+        Returns:
+            Matching messages, most recent first.
+        """
+        if limit <= 0:
+            return []
+
+        try:
+            (url,) = search_urls(query, channel, since, limit, [1])
+            first = await self._search_page(url)
+
+            pages = more_search_pages(first, limit)
+            results = await asyncio.gather(
+                *(
+                    self._search_page(url)
+                    for url in search_urls(query, channel, since, limit, pages)
+                )
+            )
+
+            return search_matches([first, *results], limit)
+        except Exception:
+            return []
+
+    async def _search_page(self, url: str) -> dict[str, Any] | None:
+        """Fetch one search.messages page, or None on failure."""
+        try:
+            return await self._request("GET", "search.messages", url=url)
+        except Exception:
+            return None
+
+    async def _post_message(self, body: bytes, channel: str) -> PostResult:
+        """Send an encoded chat.postMessage body and convert the response.
+
+        Raises:
+            RuntimeError: On authentication failure or API error.
+        """
+        return post_result(
+            await self._api_call("chat.postMessage", body, channel=channel)
+        )
+
+    async def _api_call(
+        self,
+        method: str,
+        payload: dict[str, Any] | bytes,
+        *,
+        channel: str | None = None,
+    ) -> dict[str, Any]:
+        """Make a Slack API call.
+
+        Args:
+            method: API method (e.g., "chat.postMessage").
+            payload: JSON payload, or its already encoded bytes.
+            channel: Channel whose rate-limit bucket the call counts
+                against, for per-channel methods.
+
+        Returns:
+            API response as dict.
+
+        Raises:
+            RuntimeError: On HTTP error.
+        """
+        return await self._request(
+            "POST",
+            method,
+            content=payload if isinstance(payload, bytes) else dumps(payload),
+            headers=_JSON_HEADERS,
+            channel=channel,
+        )
+
+    async def _api_get(self, method: str, params: dict[str, Any]) -> dict[str, Any]:
+        """Make a Slack API GET call with query parameters.
+
+        Raises:
+            RuntimeError: On HTTP error.
+        """
+        return await self._request("GET", method, params=params)
+
+    async def _request(
+        self,
+        http_method: str,
+        method: str,
+        *,
+        url: str | None = None,
+        channel: str | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Send a rate-limited request and decode the JSON reply.
+
+        ``url`` overrides the method's endpoint, e.g. for a prebuilt query.
+        ``channel`` picks the bucket for per-channel limits.
+
+        429 and 5xx responses are retried up to ``max_retries`` times.
+
+        Raises:
+            RuntimeError: On HTTP error or network failure.
+        """
+        buckets = self._buckets
+        bucket = buckets.bucket(method, channel) if buckets is not None else None
+
+        attempt = 0
+        while True:
+            if bucket is not None:
+                delay = bucket.reserve()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            try:
+                resp = await self._client.request(
+                    http_method, url or method, **kwargs
+                )
+            except Exception as e:
+                raise RuntimeError(f"Request failed: {e}")
+
+            if resp.status_code < 400:
+                break
+
+            status = resp.status_code
+            retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+            if bucket is not None and status == 429:
+                bucket.on_rate_limited(retry_after)
+            if status not in RETRY_STATUSES or attempt >= self.max_retries:
+                raise HTTPStatusError(status, resp.reason_phrase, retry_after)
+            await asyncio.sleep(backoff_delay(attempt, retry_after))
+            attempt += 1
+
+        if bucket is not None:
+            bucket.on_success()
+
+        try:
+            return loads(resp.content)
+        except Exception as e:
+            raise RuntimeError(f"Request failed: {e}")
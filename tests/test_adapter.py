@@ -2,13 +2,64 @@
 
 from __future__ import annotations
 
+import io
 import json
+import threading
 from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
 from unittest.mock import MagicMock, patch
+from urllib.parse import parse_qs, urlparse
 
 import pytest
 
-from herd_notify_slack import SlackNotifyAdapter
+from herd_notify_slack import PostManyError, SlackNotifyAdapter
+from herd_notify_slack._common import (
+    TokenBucket,
+    TokenBuckets,
+    TTLCache,
+    encode_message_dict,
+    encode_message_template,
+    encode_thread_reply_dict,
+    encode_thread_reply_template,
+)
+
+
+def _pool_response(
+    payload: dict,
+    status: int = 200,
+    reason: str = "OK",
+    headers: dict[str, str] | None = None,
+) -> MagicMock:
+    """Build a fake urllib3 response carrying a JSON payload."""
+    response = MagicMock()
+    response.status = status
+    response.reason = reason
+    response.headers = headers or {}
+    response.read.return_value = json.dumps(payload).encode()
+    return response
+
+
+def _mock_pool(adapter: SlackNotifyAdapter, *responses: MagicMock) -> MagicMock:
+    """Replace the adapter's connection pool with a mock."""
+    pool = MagicMock()
+    if len(responses) == 1:
+        pool.request.return_value = responses[0]
+    elif responses:
+        pool.request.side_effect = list(responses)
+    adapter._http = pool
+    return pool
+
+
+def _query(pool: MagicMock) -> dict[str, Any]:
+    """Return the query fields of the last request sent through a mock pool."""
+    return pool.request.call_args.kwargs["fields"]
+
+
+def _url_query(pool: MagicMock) -> dict[str, list[str]]:
+    """Decode the URL query string of the last request sent through a mock pool."""
+    url = pool.request.call_args[0][1]
+    return parse_qs(urlparse(url).query)
 
 
 class TestSlackNotifyAdapter:
@@ -20,21 +71,26 @@ class TestSlackNotifyAdapter:
         assert adapter.token == "xoxb-test"
         assert adapter.default_channel == "#test"
 
+    def test_slots(self):
+        """Test adapters carry no per-instance __dict__."""
+        adapter = SlackNotifyAdapter(token="xoxb-test")
+        assert not hasattr(adapter, "__dict__")
+        with pytest.raises(AttributeError):
+            adapter.unknown = True
+
     def test_post_success(self):
         """Test successful message posting."""
         adapter = SlackNotifyAdapter(token="xoxb-test")
+        _mock_pool(
+            adapter,
+            _pool_response(
+                {"ok": True, "ts": "1234567890.123456", "channel": "C123456"}
+            ),
+        )
 
-        mock_response = MagicMock()
-        mock_response.read.return_value = json.dumps(
-            {"ok": True, "ts": "1234567890.123456", "channel": "C123456"}
-        ).encode()
-        mock_response.__enter__.return_value = mock_response
-        mock_response.__exit__.return_value = None
-
-        with patch("urllib.request.urlopen", return_value=mock_response):
-            result = adapter.post(
-                "Test message", channel="#test", username="TestBot", icon=":robot:"
-            )
+        result = adapter.post(
+            "Test message", channel="#test", username="TestBot", icon=":robot:"
+        )
 
         assert result.message_id == "1234567890.123456"
         assert result.channel == "C123456"
@@ -43,247 +99,487 @@ class TestSlackNotifyAdapter:
     def test_post_uses_default_channel(self):
         """Test posting with default channel."""
         adapter = SlackNotifyAdapter(token="xoxb-test", default_channel="#default")
+        pool = _mock_pool(
+            adapter,
+            _pool_response(
+                {"ok": True, "ts": "1234567890.123456", "channel": "C123456"}
+            ),
+        )
 
-        mock_response = MagicMock()
-        mock_response.read.return_value = json.dumps(
-            {"ok": True, "ts": "1234567890.123456", "channel": "C123456"}
-        ).encode()
-        mock_response.__enter__.return_value = mock_response
-        mock_response.__exit__.return_value = None
+        adapter.post("Test message")
 
-        with patch("urllib.request.urlopen", return_value=mock_response) as mock_open:
-            adapter.post("Test message")
+        # Verify request was made with default channel
+        payload = json.loads(pool.request.call_args.kwargs["body"])
+        assert payload["channel"] == "#default"
 
-            # Verify request was made with default channel
-            request = mock_open.call_args[0][0]
-            payload = json.loads(request.data)
-            assert payload["channel"] == "#default"
+    def test_post_encodes_unicode(self):
+        """Test non-ASCII message text survives encoding."""
+        adapter = SlackNotifyAdapter(token="xoxb-test")
+        pool = _mock_pool(
+            adapter,
+            _pool_response(
+                {"ok": True, "ts": "1234567890.123456", "channel": "C123456"}
+            ),
+        )
+
+        adapter.post('Deploy "prod" ✅ — 100%')
+
+        body = pool.request.call_args.kwargs["body"]
+        assert isinstance(body, bytes)
+        assert json.loads(body)["text"] == 'Deploy "prod" ✅ — 100%'
+
+    def test_post_sends_auth_header(self):
+        """Test requests carry the bearer token."""
+        adapter = SlackNotifyAdapter(token="xoxb-test")
+        pool = _mock_pool(
+            adapter,
+            _pool_response(
+                {"ok": True, "ts": "1234567890.123456", "channel": "C123456"}
+            ),
+        )
+
+        adapter.post("Test message")
+
+        method, url = pool.request.call_args[0]
+        headers = pool.request.call_args.kwargs["headers"]
+        assert method == "POST"
+        assert url == "https://slack.com/api/chat.postMessage"
+        assert headers["Authorization"] == "Bearer xoxb-test"
+        assert headers["Content-Type"] == "application/json"
+
+    def test_post_reuses_connection_pool(self):
+        """Test consecutive calls go through the same pool."""
+        adapter = SlackNotifyAdapter(token="xoxb-test")
+        ok = {"ok": True, "ts": "1234567890.123456", "channel": "C123456"}
+        pool = _mock_pool(adapter, _pool_response(ok), _pool_response(ok))
+
+        adapter.post("First")
+        adapter.post("Second")
+
+        assert pool.request.call_count == 2
+
+    def test_adapters_share_connection_pool(self):
+        """Test adapters for different tokens share one pool."""
+        pytest.importorskip("urllib3")
+
+        first = SlackNotifyAdapter(token="xoxb-one")
+        second = SlackNotifyAdapter(token="xoxb-two")
+
+        assert first._http is not None
+        assert first._http is second._http
+        assert first._headers_auth != second._headers_auth
 
     def test_post_error(self):
         """Test posting with API error."""
         adapter = SlackNotifyAdapter(token="xoxb-test")
+        _mock_pool(adapter, _pool_response({"ok": False, "error": "invalid_auth"}))
 
-        mock_response = MagicMock()
-        mock_response.read.return_value = json.dumps(
-            {"ok": False, "error": "invalid_auth"}
-        ).encode()
-        mock_response.__enter__.return_value = mock_response
-        mock_response.__exit__.return_value = None
-
-        with patch("urllib.request.urlopen", return_value=mock_response):
-            with pytest.raises(RuntimeError, match="invalid_auth"):
-                adapter.post("Test message")
+        with pytest.raises(RuntimeError, match="invalid_auth"):
+            adapter.post("Test message")
 
     def test_post_thread_success(self):
         """Test successful thread reply."""
         adapter = SlackNotifyAdapter(token="xoxb-test")
+        pool = _mock_pool(
+            adapter,
+            _pool_response(
+                {"ok": True, "ts": "1234567890.123457", "channel": "C123456"}
+            ),
+        )
 
-        mock_response = MagicMock()
-        mock_response.read.return_value = json.dumps(
-            {"ok": True, "ts": "1234567890.123457", "channel": "C123456"}
-        ).encode()
-        mock_response.__enter__.return_value = mock_response
-        mock_response.__exit__.return_value = None
-
-        with patch("urllib.request.urlopen", return_value=mock_response):
-            result = adapter.post_thread(
-                thread_id="1234567890.123456", message="Reply", channel="#test"
-            )
+        result = adapter.post_thread(
+            thread_id="1234567890.123456", message="Reply", channel="#test"
+        )
 
         assert result.message_id == "1234567890.123457"
         assert result.channel == "C123456"
         assert result.timestamp == "1234567890.123457"
+        payload = json.loads(pool.request.call_args.kwargs["body"])
+        assert payload["thread_ts"] == "1234567890.123456"
+
+    def test_post_many_preserves_order(self):
+        """Test concurrent posts return results in input order."""
+        adapter = SlackNotifyAdapter(token="xoxb-test", max_workers=4)
+        pool = _mock_pool(adapter)
+
+        def respond(method, url, *, body, **kwargs):
+            text = json.loads(body)["text"]
+            return _pool_response({"ok": True, "ts": text, "channel": "C123456"})
+
+        pool.request.side_effect = respond
+
+        results = adapter.post_many([f"Message {i}" for i in range(10)])
+
+        assert [r.message_id for r in results] == [f"Message {i}" for i in range(10)]
+        assert pool.request.call_count == 10
+
+    def test_post_many_error(self):
+        """Test a failed post in a batch is raised."""
+        adapter = SlackNotifyAdapter(token="xoxb-test")
+        _mock_pool(adapter, _pool_response({"ok": False, "error": "rate_limited"}))
+
+        with pytest.raises(PostManyError, match="rate_limited"):
+            adapter.post_many(["Test message"])
+
+    def test_post_many_partial_failure(self):
+        """Test a failed post keeps the results of the ones delivered."""
+        adapter = SlackNotifyAdapter(token="xoxb-test")
+        pool = _mock_pool(adapter)
+
+        def respond(method, url, *, body, **kwargs):
+            text = json.loads(body)["text"]
+            if text == "Message 1":
+                return _pool_response({"ok": False, "error": "msg_too_long"})
+            return _pool_response({"ok": True, "ts": text, "channel": "C123456"})
+
+        pool.request.side_effect = respond
+
+        with pytest.raises(PostManyError, match="1 of 3 posts failed") as exc_info:
+            adapter.post_many([f"Message {i}" for i in range(3)])
+
+        results = exc_info.value.results
+        assert results[0].message_id == "Message 0"
+        assert results[1] is None
+        assert results[2].message_id == "Message 2"
+        assert list(exc_info.value.errors) == [1]
+        assert "msg_too_long" in str(exc_info.value.errors[1])
+
+    def test_close(self):
+        """Test close shuts down the worker pool but keeps shared connections."""
+        pool = MagicMock()
+
+        with SlackNotifyAdapter(token="xoxb-test") as adapter:
+            adapter._http = pool
+
+        pool.clear.assert_not_called()
+        with pytest.raises(RuntimeError, match="SlackNotifyAdapter is closed"):
+            adapter.post_many(["Test message"])
+        pool.request.assert_not_called()
 
     def test_get_thread_replies_success(self):
         """Test fetching thread replies."""
         adapter = SlackNotifyAdapter(token="xoxb-test")
+        pool = _mock_pool(
+            adapter,
+            _pool_response(
+                {
+                    "ok": True,
+                    "messages": [
+                        {
+                            "user": "U123",
+                            "text": "Parent message",
+                            "ts": "1234567890.123456",
+                        },
+                        {
+                            "user": "U456",
+                            "text": "First reply",
+                            "ts": "1234567890.123457",
+                        },
+                        {
+                            "user": "U789",
+                            "text": "Second reply",
+                            "ts": "1234567890.123458",
+                        },
+                    ],
+                }
+            ),
+        )
 
-        mock_response = MagicMock()
-        mock_response.read.return_value = json.dumps(
-            {
-                "ok": True,
-                "messages": [
-                    {
-                        "user": "U123",
-                        "text": "Parent message",
-                        "ts": "1234567890.123456",
-                    },
-                    {
-                        "user": "U456",
-                        "text": "First reply",
-                        "ts": "1234567890.123457",
-                    },
-                    {
-                        "user": "U789",
-                        "text": "Second reply",
-                        "ts": "1234567890.123458",
-                    },
-                ],
-            }
-        ).encode()
-        mock_response.__enter__.return_value = mock_response
-        mock_response.__exit__.return_value = None
-
-        with patch("urllib.request.urlopen", return_value=mock_response):
-            replies = adapter.get_thread_replies(
-                channel="C123456", thread_id="1234567890.123456"
-            )
+        replies = adapter.get_thread_replies(
+            channel="C123456", thread_id="1234567890.123456"
+        )
 
         assert len(replies) == 2  # Excludes parent
         assert replies[0].author == "U456"
         assert replies[0].text == "First reply"
+        assert replies[0].timestamp == "1234567890.123457"
         assert replies[1].author == "U789"
         assert replies[1].text == "Second reply"
+        method, url = pool.request.call_args[0]
+        assert method == "GET"
+        assert url == "https://slack.com/api/conversations.replies"
+        assert _query(pool) == {"channel": "C123456", "ts": "1234567890.123456"}
 
     def test_get_thread_replies_no_replies(self):
         """Test fetching thread with no replies."""
         adapter = SlackNotifyAdapter(token="xoxb-test")
+        _mock_pool(
+            adapter,
+            _pool_response(
+                {
+                    "ok": True,
+                    "messages": [
+                        {
+                            "user": "U123",
+                            "text": "Parent message",
+                            "ts": "1234567890.123456",
+                        }
+                    ],
+                }
+            ),
+        )
 
-        mock_response = MagicMock()
-        mock_response.read.return_value = json.dumps(
-            {
-                "ok": True,
-                "messages": [
-                    {
-                        "user": "U123",
-                        "text": "Parent message",
-                        "ts": "1234567890.123456",
-                    }
-                ],
-            }
-        ).encode()
-
-        with patch("urllib.request.urlopen", return_value=mock_response):
-            replies = adapter.get_thread_replies(
-                channel="C123456", thread_id="1234567890.123456"
-            )
+        replies = adapter.get_thread_replies(
+            channel="C123456", thread_id="1234567890.123456"
+        )
 
         assert len(replies) == 0
 
     def test_get_thread_replies_error(self):
         """Test fetching thread replies with error."""
         adapter = SlackNotifyAdapter(token="xoxb-test")
+        _mock_pool(adapter, _pool_response({"ok": False}))
 
-        mock_response = MagicMock()
-        mock_response.read.return_value = json.dumps({"ok": False}).encode()
-
-        with patch("urllib.request.urlopen", return_value=mock_response):
-            replies = adapter.get_thread_replies(
-                channel="C123456", thread_id="1234567890.123456"
-            )
+        replies = adapter.get_thread_replies(
+            channel="C123456", thread_id="1234567890.123456"
+        )
 
         assert len(replies) == 0
 
+    def test_get_thread_replies_http_error(self):
+        """Test fetching thread replies swallows HTTP errors."""
+        adapter = SlackNotifyAdapter(token="xoxb-test")
+        _mock_pool(adapter, _pool_response({}, status=404, reason="Not Found"))
+
+        replies = adapter.get_thread_replies(
+            channel="C123456", thread_id="1234567890.123456"
+        )
+
+        assert replies == []
+
     def test_search_success(self):
         """Test successful message search."""
         adapter = SlackNotifyAdapter(token="xoxb-test")
+        _mock_pool(
+            adapter,
+            _pool_response(
+                {
+                    "ok": True,
+                    "messages": {
+                        "matches": [
+                            {
+                                "user": "U123",
+                                "text": "Found message 1",
+                                "ts": "1234567890.123456",
+                            },
+                            {
+                                "username": "bot",
+                                "text": "Found message 2",
+                                "ts": "1234567890.123457",
+                            },
+                            {"text": "Found message 3", "ts": "1234567890.123458"},
+                        ]
+                    },
+                }
+            ),
+        )
 
-        mock_response = MagicMock()
-        mock_response.read.return_value = json.dumps(
-            {
-                "ok": True,
-                "messages": {
-                    "matches": [
-                        {
-                            "user": "U123",
-                            "text": "Found message 1",
-                            "ts": "1234567890.123456",
-                        },
-                        {
-                            "username": "bot",
-                            "text": "Found message 2",
-                            "ts": "1234567890.123457",
-                        },
-                    ]
-                },
-            }
-        ).encode()
-        mock_response.__enter__.return_value = mock_response
-        mock_response.__exit__.return_value = None
-
-        with patch("urllib.request.urlopen", return_value=mock_response):
-            results = adapter.search("test query")
+        results = adapter.search("test query")
 
-        assert len(results) == 2
+        assert len(results) == 3
         assert results[0].author == "U123"
         assert results[0].text == "Found message 1"
         assert results[1].author == "bot"
         assert results[1].text == "Found message 2"
+        assert results[1].timestamp == "1234567890.123457"
+        assert results[2].author == "unknown"
 
     def test_search_with_channel_filter(self):
         """Test search with channel filter."""
         adapter = SlackNotifyAdapter(token="xoxb-test")
+        pool = _mock_pool(
+            adapter, _pool_response({"ok": True, "messages": {"matches": []}})
+        )
 
-        mock_response = MagicMock()
-        mock_response.read.return_value = json.dumps(
-            {"ok": True, "messages": {"matches": []}}
-        ).encode()
-        mock_response.__enter__.return_value = mock_response
-        mock_response.__exit__.return_value = None
+        adapter.search("test query", channel="#specific")
 
-        with patch("urllib.request.urlopen", return_value=mock_response) as mock_open:
-            adapter.search("test query", channel="#specific")
-
-            # Verify query includes channel filter
-            request = mock_open.call_args[0][0]
-            assert "in%3A%23specific" in request.full_url
+        # Verify query includes channel filter
+        assert _url_query(pool)["query"] == ["test query in:#specific"]
 
     def test_search_with_since_filter(self):
         """Test search with since filter."""
         adapter = SlackNotifyAdapter(token="xoxb-test")
+        pool = _mock_pool(
+            adapter, _pool_response({"ok": True, "messages": {"matches": []}})
+        )
 
-        mock_response = MagicMock()
-        mock_response.read.return_value = json.dumps(
-            {"ok": True, "messages": {"matches": []}}
-        ).encode()
+        since = datetime(2026, 2, 14)
 
+        adapter.search("test query", since=since)
+
+        # Verify query includes date filter
+        assert _url_query(pool)["query"] == ["test query after:2026-02-14"]
+
+    def test_search_url_memoized(self):
+        """Test repeated identical searches reuse the built URL."""
+        adapter = SlackNotifyAdapter(token="xoxb-test")
+        pool = _mock_pool(adapter)
+        pool.request.side_effect = lambda *a, **kw: _pool_response(
+            {"ok": True, "messages": {"matches": []}}
+        )
         since = datetime(2026, 2, 14)
 
-        with patch("urllib.request.urlopen", return_value=mock_response) as mock_open:
-            adapter.search("test query", since=since)
+        adapter.search("memo query", channel="#memo", since=since, limit=10)
+        first_url = pool.request.call_args[0][1]
+        adapter.search("memo query", channel="#memo", since=since, limit=10)
 
-            # Verify query includes date filter
-            request = mock_open.call_args[0][0]
-            assert "after%3A2026-02-14" in request.full_url
+        assert pool.request.call_args[0][1] is first_url
+        assert _url_query(pool)["count"] == ["10"]
 
     def test_search_with_limit(self):
         """Test search respects limit."""
         adapter = SlackNotifyAdapter(token="xoxb-test")
 
         # Return more results than limit
-        mock_response = MagicMock()
-        mock_response.read.return_value = json.dumps(
-            {
-                "ok": True,
-                "messages": {
-                    "matches": [
-                        {
-                            "user": f"U{i}",
-                            "text": f"Message {i}",
-                            "ts": f"1234567890.{i}",
-                        }
-                        for i in range(100)
-                    ]
-                },
-            }
-        ).encode()
-        mock_response.__enter__.return_value = mock_response
-        mock_response.__exit__.return_value = None
+        _mock_pool(
+            adapter,
+            _pool_response(
+                {
+                    "ok": True,
+                    "messages": {
+                        "matches": [
+                            {
+                                "user": f"U{i}",
+                                "text": f"Message {i}",
+                                "ts": f"1234567890.{i}",
+                            }
+                            for i in range(100)
+                        ]
+                    },
+                }
+            ),
+        )
 
-        with patch("urllib.request.urlopen", return_value=mock_response):
-            results = adapter.search("test query", limit=10)
+        results = adapter.search("test query", limit=10)
 
         assert len(results) == 10
 
+    @staticmethod
+    def _paged_search(pool: MagicMock, total: int, failing_page: int = 0) -> None:
+        """Serve ``total`` matches in pages sized by the request's count."""
+
+        def respond(method, url, **kwargs):
+            params = parse_qs(urlparse(url).query)
+            count, page = int(params["count"][0]), int(params["page"][0])
+            if page == failing_page:
+                return _pool_response({"ok": False, "error": "internal_error"})
+            start = (page - 1) * count
+            return _pool_response(
+                {
+                    "ok": True,
+                    "messages": {
+                        "matches": [
+                            {"user": f"U{i}", "text": f"Message {i}", "ts": f"{i}.0"}
+                            for i in range(start, min(start + count, total))
+                        ],
+                        "paging": {
+                            "count": count,
+                            "total": total,
+                            "page": page,
+                            "pages": -(-total // count),
+                        },
+                    },
+                }
+            )
+
+        pool.request.side_effect = respond
+
+    def test_search_paginates(self):
+        """Test limits above one page fetch and merge every page in order."""
+        adapter = SlackNotifyAdapter(token="xoxb-test")
+        pool = _mock_pool(adapter)
+        self._paged_search(pool, total=1000)
+
+        results = adapter.search("test query", limit=250)
+
+        assert pool.request.call_count == 3
+        assert len(results) == 250
+        assert [r.text for r in results] == [f"Message {i}" for i in range(250)]
+
+    def test_search_stops_at_last_page(self):
+        """Test only the pages Slack reports are requested."""
+        adapter = SlackNotifyAdapter(token="xoxb-test")
+        pool = _mock_pool(adapter)
+        self._paged_search(pool, total=150)
+
+        results = adapter.search("test query", limit=500)
+
+        assert pool.request.call_count == 2
+        assert len(results) == 150
+
+    def test_search_small_result_large_limit(self):
+        """Test a large limit costs one rate-limited call for a short result."""
+        adapter = SlackNotifyAdapter(token="xoxb-test")
+        pool = _mock_pool(adapter)
+        self._paged_search(pool, total=1)
+
+        with patch("herd_notify_slack.adapter.time.sleep") as sleep:
+            results = adapter.search("test query", limit=1000)
+
+        assert pool.request.call_count == 1
+        assert len(results) == 1
+        sleep.assert_not_called()
+
+    def test_search_stops_at_failed_page(self):
+        """Test a failed page truncates results instead of leaving a gap."""
+        adapter = SlackNotifyAdapter(token="xoxb-test")
+        pool = _mock_pool(adapter)
+        self._paged_search(pool, total=1000, failing_page=2)
+
+        results = adapter.search("test query", limit=300)
+
+        assert [r.text for r in results] == [f"Message {i}" for i in range(100)]
+
+    def test_search_after_close(self):
+        """Test a closed adapter still fetches every result page."""
+        adapter = SlackNotifyAdapter(token="xoxb-test")
+        pool = _mock_pool(adapter)
+        self._paged_search(pool, total=1000)
+        adapter.close()
+
+        results = adapter.search("test query", limit=250)
+
+        assert pool.request.call_count == 3
+        assert [r.text for r in results] == [f"Message {i}" for i in range(250)]
+
+    def test_search_malformed_paging(self):
+        """Test unusable paging info keeps the first page."""
+        adapter = SlackNotifyAdapter(token="xoxb-test")
+        pool = _mock_pool(
+            adapter,
+            _pool_response(
+                {
+                    "ok": True,
+                    "messages": {
+                        "matches": [
+                            {"user": "U1", "text": str(i), "ts": f"{i}.0"}
+                            for i in range(100)
+                        ],
+                        "paging": {"total": None},
+                    },
+                }
+            ),
+        )
+
+        results = adapter.search("test query", limit=200)
+
+        assert pool.request.call_count == 1
+        assert len(results) == 100
+
+    def test_search_zero_limit(self):
+        """Test a non-positive limit makes no request."""
+        adapter = SlackNotifyAdapter(token="xoxb-test")
+        pool = _mock_pool(adapter)
+
+        assert adapter.search("test query", limit=0) == []
+        pool.request.assert_not_called()
+
     def test_search_error(self):
         """Test search with error."""
         adapter = SlackNotifyAdapter(token="xoxb-test")
+        _mock_pool(adapter, _pool_response({"ok": False}))
 
-        mock_response = MagicMock()
-        mock_response.read.return_value = json.dumps({"ok": False}).encode()
-
-        with patch("urllib.request.urlopen", return_value=mock_response):
-            results = adapter.search("test query")
+        results = adapter.search("test query")
 
         assert len(results) == 0
 
@@ -296,9 +592,596 @@ class TestSlackNotifyAdapter:
 
     def test_http_error_handling(self):
         """Test HTTP error handling."""
-        import urllib.error
+        adapter = SlackNotifyAdapter(token="xoxb-test")
+        _mock_pool(adapter, _pool_response({}, status=401, reason="Unauthorized"))
 
+        with pytest.raises(RuntimeError, match="HTTP error: 401"):
+            adapter.post("Test message")
+
+    def test_network_error_handling(self):
+        """Test network error handling."""
+        adapter = SlackNotifyAdapter(token="xoxb-test")
+        pool = _mock_pool(adapter)
+        pool.request.side_effect = Exception("Network error")
+
+        with pytest.raises(RuntimeError, match="Request failed"):
+            adapter.post("Test message")
+
+    def test_invalid_json_handling(self):
+        """Test non-JSON responses surface as request failures."""
+        adapter = SlackNotifyAdapter(token="xoxb-test")
+        response = _pool_response({})
+        response.read.return_value = b"<html>gateway timeout</html>"
+        _mock_pool(adapter, response)
+
+        with pytest.raises(RuntimeError, match="Request failed"):
+            adapter.post("Test message")
+
+
+_MESSAGE_ENCODERS = pytest.mark.parametrize(
+    "encode", [encode_message_dict, encode_message_template]
+)
+_THREAD_REPLY_ENCODERS = pytest.mark.parametrize(
+    "encode", [encode_thread_reply_dict, encode_thread_reply_template]
+)
+
+
+class TestEncodeMessage:
+    """Test suite for the chat.postMessage encoders."""
+
+    @_MESSAGE_ENCODERS
+    @pytest.mark.parametrize(
+        ("kwargs", "extra"),
+        [
+            ({}, {}),
+            ({"username": "Bot"}, {"username": "Bot"}),
+            ({"icon": ":robot:"}, {"icon_emoji": ":robot:"}),
+            (
+                {"username": "Bot", "icon": ":robot:"},
+                {"username": "Bot", "icon_emoji": ":robot:"},
+            ),
+            ({"username": "", "icon": None}, {}),
+        ],
+    )
+    def test_message_shapes(self, encode, kwargs, extra):
+        """Test each optional field combination encodes the right keys."""
+        body = encode("#test", "Hello", **kwargs)
+
+        assert json.loads(body) == {"channel": "#test", "text": "Hello", **extra}
+
+    @_MESSAGE_ENCODERS
+    def test_escapes_values(self, encode):
+        """Test quotes, newlines and non-ASCII text are escaped safely."""
+        text = 'say "hi"\n\\ ✅ </script>'
+
+        body = encode("#test", text, username='a"b')
+
+        assert json.loads(body) == {
+            "channel": "#test",
+            "text": text,
+            "username": 'a"b',
+        }
+
+    @_THREAD_REPLY_ENCODERS
+    def test_thread_reply(self, encode):
+        """Test thread replies carry thread_ts."""
+        body = encode("#test", "Reply", "1234567890.123456")
+
+        assert json.loads(body) == {
+            "channel": "#test",
+            "text": "Reply",
+            "thread_ts": "1234567890.123456",
+        }
+
+
+class TestPoolResponse:
+    """Test suite for reading pooled urllib3 responses."""
+
+    def test_releases_connection(self):
+        """Test pooled connections are returned after reading."""
+        adapter = SlackNotifyAdapter(token="xoxb-test")
+        response = _pool_response(
+            {"ok": True, "ts": "1234567890.123456", "channel": "C123456"}
+        )
+        pool = _mock_pool(adapter, response)
+
+        adapter.post("Test message")
+
+        assert pool.request.call_args.kwargs["preload_content"] is False
+        response.release_conn.assert_called_once()
+
+    def test_pool_response_read_whole(self):
+        """Test urllib3 bodies are read with read(), not the copying readinto()."""
+        urllib3 = pytest.importorskip("urllib3")
+        data = json.dumps({"ok": True, "ts": "1.0", "channel": "C1"}).encode()
+        response = urllib3.HTTPResponse(
+            body=io.BytesIO(data),
+            headers={"Content-Length": str(len(data))},
+            status=200,
+            preload_content=False,
+        )
+        adapter = SlackNotifyAdapter(token="xoxb-test")
+        _mock_pool(adapter, response)
+
+        with patch.object(
+            urllib3.HTTPResponse, "readinto", side_effect=AssertionError
+        ):
+            result = adapter.post("Test message")
+
+        assert result.message_id == "1.0"
+
+
+class TestRetries:
+    """Test suite for retrying transient HTTP errors."""
+
+    def test_retries_server_error(self):
+        """Test 5xx responses are retried until success."""
+        adapter = SlackNotifyAdapter(token="xoxb-test")
+        pool = _mock_pool(
+            adapter,
+            _pool_response({}, status=503, reason="Service Unavailable"),
+            _pool_response({}, status=502, reason="Bad Gateway"),
+            _pool_response(
+                {"ok": True, "ts": "1234567890.123456", "channel": "C123456"}
+            ),
+        )
+
+        with patch("herd_notify_slack.adapter.time.sleep") as sleep:
+            result = adapter.post("Test message")
+
+        assert result.message_id == "1234567890.123456"
+        assert pool.request.call_count == 3
+        assert sleep.call_count == 2
+        # Full jitter stays within the exponential envelope
+        assert 0 <= sleep.call_args_list[0][0][0] <= 0.5
+        assert 0 <= sleep.call_args_list[1][0][0] <= 1.0
+
+    def test_honors_retry_after(self):
+        """Test 429 waits for Slack's Retry-After before retrying."""
+        adapter = SlackNotifyAdapter(token="xoxb-test", rate_limit=False)
+        _mock_pool(
+            adapter,
+            _pool_response(
+                {}, status=429, reason="Too Many Requests", headers={"Retry-After": "7"}
+            ),
+            _pool_response(
+                {"ok": True, "ts": "1234567890.123456", "channel": "C123456"}
+            ),
+        )
+
+        with patch("herd_notify_slack.adapter.time.sleep") as sleep:
+            adapter.post("Test message")
+
+        sleep.assert_called_once_with(7.0)
+
+    def test_gives_up_after_max_retries(self):
+        """Test the last error is raised once retries are exhausted."""
+        adapter = SlackNotifyAdapter(token="xoxb-test", max_retries=2)
+        pool = _mock_pool(
+            adapter, _pool_response({}, status=500, reason="Internal Server Error")
+        )
+
+        with patch("herd_notify_slack.adapter.time.sleep"):
+            with pytest.raises(RuntimeError, match="HTTP error: 500"):
+                adapter.post("Test message")
+
+        assert pool.request.call_count == 3
+
+    def test_does_not_retry_client_error(self):
+        """Test non-transient errors fail immediately."""
+        adapter = SlackNotifyAdapter(token="xoxb-test")
+        pool = _mock_pool(adapter, _pool_response({}, status=403, reason="Forbidden"))
+
+        with patch("herd_notify_slack.adapter.time.sleep") as sleep:
+            with pytest.raises(RuntimeError, match="HTTP error: 403"):
+                adapter.post("Test message")
+
+        assert pool.request.call_count == 1
+        sleep.assert_not_called()
+
+    def test_shared_pool_does_not_retry_statuses(self):
+        """Test urllib3 leaves 429 retries to the adapter and its limiter."""
+        pytest.importorskip("urllib3")
+        hits = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                hits.append(self.path)
+                self.send_response(429)
+                self.send_header("Retry-After", "0")
+                self.send_header("Content-Length", "2")
+                self.end_headers()
+                self.wfile.write(b"{}")
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        adapter = SlackNotifyAdapter(token="xoxb-test", max_retries=1)
+        url = f"http://127.0.0.1:{server.server_port}/conversations.replies"
+
+        try:
+            with patch("herd_notify_slack.adapter.time.sleep"):
+                with pytest.raises(RuntimeError, match="HTTP error: 429"):
+                    adapter._request(
+                        "GET",
+                        "conversations.replies",
+                        url=url,
+                        headers=adapter._headers_auth,
+                    )
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert len(hits) == 2
+        bucket = adapter._buckets[("conversations.replies", None)]
+        assert bucket.rate == pytest.approx(bucket.max_rate * 0.25)
+
+
+class TestTokenBucket:
+    """Test suite for the client-side rate limiter."""
+
+    def test_burst_then_wait(self):
+        """Test the burst is free and the next call must wait."""
+        bucket = TokenBucket(rate=1.0, capacity=3)
+
+        assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert bucket.reserve() == pytest.approx(1.0, abs=0.05)
+        # Queued callers wait behind each other
+        assert bucket.reserve() == pytest.approx(2.0, abs=0.05)
+
+    def test_rate_limited_backs_off(self):
+        """Test 429 halves the rate and honors Retry-After."""
+        bucket = TokenBucket(rate=1.0, capacity=3)
+
+        bucket.on_rate_limited(retry_after=30)
+
+        assert bucket.rate == pytest.approx(0.5)
+        assert bucket.reserve() == pytest.approx(30, abs=0.05)
+
+    def test_success_recovers_up_to_limit(self):
+        """Test successes raise the rate additively, capped at the limit."""
+        bucket = TokenBucket(rate=1.0, capacity=3)
+        bucket.on_rate_limited()
+
+        bucket.on_success()
+        assert bucket.rate == pytest.approx(0.55)
+
+        for _ in range(100):
+            bucket.on_success()
+        assert bucket.rate == pytest.approx(1.0)
+
+    def test_for_method_uses_slack_tiers(self):
+        """Test buckets are sized per Slack method."""
+        assert TokenBucket.for_method("search.messages").max_rate == pytest.approx(
+            20 / 60
+        )
+        assert TokenBucket.for_method("users.info").max_rate == pytest.approx(
+            50 / 60
+        )
+
+    def test_adapter_throttles_on_429(self):
+        """Test a 429 from Slack slows the method's bucket."""
+        adapter = SlackNotifyAdapter(token="xoxb-test", max_retries=0)
+        _mock_pool(
+            adapter,
+            _pool_response(
+                {}, status=429, reason="Too Many Requests", headers={"Retry-After": "0"}
+            ),
+        )
+
+        with pytest.raises(RuntimeError, match="HTTP error: 429"):
+            adapter.post("Test message")
+
+        bucket = adapter._buckets[("chat.postMessage", "#herd-feed")]
+        assert bucket.rate == pytest.approx(0.5)
+
+    def test_buckets_evict_least_recently_used(self):
+        """Test per-channel buckets are bounded."""
+        buckets = TokenBuckets(maxsize=2)
+        first = buckets.bucket("chat.postMessage", "#a")
+        buckets.bucket("chat.postMessage", "#b")
+        assert buckets.bucket("chat.postMessage", "#a") is first
+
+        buckets.bucket("chat.postMessage", "#c")
+
+        assert len(buckets) == 2
+        assert buckets[("chat.postMessage", "#a")] is first
+        with pytest.raises(KeyError):
+            buckets[("chat.postMessage", "#b")]
+
+    def test_post_buckets_per_channel(self):
+        """Test posts to different channels don't wait on each other."""
+        adapter = SlackNotifyAdapter(token="xoxb-test")
+        _mock_pool(adapter, _pool_response({"ok": True, "ts": "1.0", "channel": "C1"}))
+
+        with patch("herd_notify_slack.adapter.time.sleep") as sleep:
+            for i in range(15):
+                adapter.post("Test message", channel=f"#channel-{i}")
+
+        sleep.assert_not_called()
+
+    def test_post_paced_within_channel(self):
+        """Test posts past the burst to one channel are paced."""
         adapter = SlackNotifyAdapter(token="xoxb-test")
+        _mock_pool(adapter, _pool_response({"ok": True, "ts": "1.0", "channel": "C1"}))
+
+        with patch("herd_notify_slack.adapter.time.sleep") as sleep:
+            for _ in range(11):
+                adapter.post("Test message", channel="#busy")
+
+        sleep.assert_called_once()
+
+    def test_adapter_rate_limit_disabled(self):
+        """Test rate limiting can be turned off."""
+        adapter = SlackNotifyAdapter(token="xoxb-test", rate_limit=False)
+        _mock_pool(
+            adapter,
+            _pool_response(
+                {"ok": True, "ts": "1234567890.123456", "channel": "C123456"}
+            ),
+        )
+
+        adapter.post("Test message")
+
+        assert adapter._buckets is None
+
+
+class TestThreadCache:
+    """Test suite for caching thread replies between polls."""
+
+    @staticmethod
+    def _replies_response() -> MagicMock:
+        return _pool_response(
+            {
+                "ok": True,
+                "messages": [
+                    {"user": "U123", "text": "Parent", "ts": "1.0"},
+                    {"user": "U456", "text": "Reply", "ts": "1.1"},
+                ],
+            }
+        )
+
+    def test_disabled_by_default(self):
+        """Test every poll hits Slack unless a TTL is set."""
+        adapter = SlackNotifyAdapter(token="xoxb-test")
+        pool = _mock_pool(adapter)
+        pool.request.side_effect = lambda *a, **kw: self._replies_response()
+
+        adapter.get_thread_replies("C123456", "1.0")
+        adapter.get_thread_replies("C123456", "1.0")
+
+        assert pool.request.call_count == 2
+
+    def test_repeat_poll_served_from_cache(self):
+        """Test repeated polls within the TTL reuse the first response."""
+        adapter = SlackNotifyAdapter(token="xoxb-test", thread_cache_ttl=5)
+        pool = _mock_pool(adapter, self._replies_response())
+
+        first = adapter.get_thread_replies("C123456", "1.0")
+        first.clear()
+        second = adapter.get_thread_replies("C123456", "1.0")
+
+        assert pool.request.call_count == 1
+        assert [r.text for r in second] == ["Reply"]
+
+    def test_errors_not_cached(self):
+        """Test failed fetches are retried on the next poll."""
+        adapter = SlackNotifyAdapter(token="xoxb-test", thread_cache_ttl=5)
+        pool = _mock_pool(
+            adapter, _pool_response({"ok": False}), self._replies_response()
+        )
+
+        assert adapter.get_thread_replies("C123456", "1.0") == []
+        assert len(adapter.get_thread_replies("C123456", "1.0")) == 1
+        assert pool.request.call_count == 2
+
+    def test_post_thread_invalidates(self):
+        """Test replying to a thread drops its cached replies."""
+        adapter = SlackNotifyAdapter(token="xoxb-test", thread_cache_ttl=5)
+        pool = _mock_pool(
+            adapter,
+            self._replies_response(),
+            _pool_response({"ok": True, "ts": "1.2", "channel": "C123456"}),
+            self._replies_response(),
+        )
+
+        adapter.get_thread_replies("C123456", "1.0")
+        adapter.post_thread("1.0", "Another reply", channel="C123456")
+        adapter.get_thread_replies("C123456", "1.0")
+
+        assert pool.request.call_count == 3
+
+    def test_ttl_expiry_and_eviction(self):
+        """Test entries expire after the TTL and the oldest are evicted."""
+        cache = TTLCache(ttl=5, maxsize=2)
+
+        with patch("herd_notify_slack._common.time.monotonic", return_value=100.0):
+            cache.put("a", 1)
+            cache.put("b", 2)
+            cache.put("c", 3)
+            assert cache.get("a") is None
+            assert cache.get("b") == 2
+
+        with patch("herd_notify_slack._common.time.monotonic", return_value=105.0):
+            assert cache.get("c") is None
+
+
+class TestHTTP2Client:
+    """Test suite for the optional httpx transport."""
+
+    @staticmethod
+    def _adapter(handler) -> SlackNotifyAdapter:
+        httpx = pytest.importorskip("httpx")
+        adapter = SlackNotifyAdapter(token="xoxb-test")
+        adapter._client = httpx.Client(transport=httpx.MockTransport(handler))
+        return adapter
+
+    def test_init_http2(self):
+        """Test http2=True builds a multiplexing httpx client."""
+        httpx = pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+
+        with patch.object(httpx, "Client", wraps=httpx.Client) as client_cls:
+            adapter = SlackNotifyAdapter(token="xoxb-test", http2=True)
+
+        with adapter:
+            assert client_cls.call_args.kwargs["http2"] is True
+            assert isinstance(adapter._client, httpx.Client)
+
+    def test_init_http2_without_httpx(self):
+        """Test http2=True without httpx raises a helpful ImportError."""
+        with patch("herd_notify_slack.adapter.httpx", None):
+            with pytest.raises(ImportError, match="requires httpx"):
+                SlackNotifyAdapter(token="xoxb-test", http2=True)
+
+    def test_init_http2_without_h2(self):
+        """Test http2=True without h2 raises a helpful ImportError."""
+        with patch("herd_notify_slack.adapter.HAS_H2", False):
+            with pytest.raises(ImportError, match="requires httpx with h2"):
+                SlackNotifyAdapter(token="xoxb-test", http2=True)
+
+    def test_post_success(self):
+        """Test posts go through the httpx client when enabled."""
+        httpx = pytest.importorskip("httpx")
+
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(
+                200, json={"ok": True, "ts": "1234567890.123456", "channel": "C1"}
+            )
+
+        adapter = self._adapter(handler)
+        adapter._http = MagicMock()
+
+        result = adapter.post("Test message")
+
+        assert result.message_id == "1234567890.123456"
+        assert requests[0].headers["Authorization"] == "Bearer xoxb-test"
+        assert json.loads(requests[0].content)["text"] == "Test message"
+        adapter._http.request.assert_not_called()
+
+    def test_get_thread_replies_params(self):
+        """Test GET fields are sent as query parameters."""
+        httpx = pytest.importorskip("httpx")
+
+        def handler(request):
+            assert request.url.params["channel"] == "C123456"
+            assert request.url.params["ts"] == "1.0"
+            return httpx.Response(
+                200,
+                json={
+                    "ok": True,
+                    "messages": [
+                        {"user": "U123", "text": "Parent", "ts": "1.0"},
+                        {"user": "U456", "text": "Reply", "ts": "1.1"},
+                    ],
+                },
+            )
+
+        adapter = self._adapter(handler)
+
+        replies = adapter.get_thread_replies("C123456", "1.0")
+
+        assert [r.author for r in replies] == ["U456"]
+
+    def test_http_error_handling(self):
+        """Test HTTP errors surface like the other transports."""
+        httpx = pytest.importorskip("httpx")
+
+        adapter = self._adapter(lambda request: httpx.Response(401))
+
+        with pytest.raises(RuntimeError, match="HTTP error: 401"):
+            adapter.post("Test message")
+
+    def test_close(self):
+        """Test close shuts down the client."""
+        httpx = pytest.importorskip("httpx")
+
+        adapter = self._adapter(lambda request: httpx.Response(200, json={}))
+
+        adapter.close()
+
+        assert adapter._client.is_closed
+
+
+class TestStdlibFallback:
+    """Test suite for the urllib fallback used when urllib3 is missing."""
+
+    @staticmethod
+    def _adapter(**kwargs) -> SlackNotifyAdapter:
+        adapter = SlackNotifyAdapter(token="xoxb-test", **kwargs)
+        adapter._http = None
+        return adapter
+
+    @staticmethod
+    def _response(payload: dict) -> MagicMock:
+        mock_response = MagicMock()
+        mock_response.headers = {}
+        mock_response.read.return_value = json.dumps(payload).encode()
+        mock_response.__enter__.return_value = mock_response
+        mock_response.__exit__.return_value = None
+        return mock_response
+
+    def test_post_success(self):
+        """Test successful message posting."""
+        adapter = self._adapter(default_channel="#default")
+        mock_response = self._response(
+            {"ok": True, "ts": "1234567890.123456", "channel": "C123456"}
+        )
+
+        with patch("urllib.request.urlopen", return_value=mock_response) as mock_open:
+            result = adapter.post("Test message")
+
+            request = mock_open.call_args[0][0]
+            payload = json.loads(request.data)
+            assert payload["channel"] == "#default"
+            assert request.get_method() == "POST"
+
+        assert result.message_id == "1234567890.123456"
+
+    def test_get_thread_replies_success(self):
+        """Test fetching thread replies."""
+        adapter = self._adapter()
+        mock_response = self._response(
+            {
+                "ok": True,
+                "messages": [
+                    {"user": "U123", "text": "Parent", "ts": "1.0"},
+                    {"user": "U456", "text": "Reply", "ts": "1.1"},
+                ],
+            }
+        )
+
+        with patch("urllib.request.urlopen", return_value=mock_response) as mock_open:
+            replies = adapter.get_thread_replies(channel="C123456", thread_id="1.0")
+
+            request = mock_open.call_args[0][0]
+            assert request.get_method() == "GET"
+            assert "channel=C123456" in request.full_url
+
+        assert len(replies) == 1
+        assert replies[0].author == "U456"
+
+    def test_search_with_channel_filter(self):
+        """Test search with channel filter."""
+        adapter = self._adapter()
+        mock_response = self._response({"ok": True, "messages": {"matches": []}})
+
+        with patch("urllib.request.urlopen", return_value=mock_response) as mock_open:
+            adapter.search("test query", channel="#specific")
+
+            request = mock_open.call_args[0][0]
+            assert "in%3A%23specific" in request.full_url
+
+    def test_http_error_handling(self):
+        """Test HTTP error handling."""
+        import urllib.error
+
+        adapter = self._adapter()
 
         with patch(
             "urllib.request.urlopen",
@@ -315,7 +1198,7 @@ class TestSlackNotifyAdapter:
 
     def test_network_error_handling(self):
         """Test network error handling."""
-        adapter = SlackNotifyAdapter(token="xoxb-test")
+        adapter = self._adapter()
 
         with patch(
             "urllib.request.urlopen", side_effect=Exception("Network error")
@@ -0,0 +1,272 @@
+"""Tests for AsyncSlackNotifyAdapter."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Callable
+from unittest.mock import patch
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from herd_notify_slack import AsyncSlackNotifyAdapter  # noqa: E402
+
+
+def _adapter(
+    handler: Callable[[httpx.Request], httpx.Response], **kwargs
+) -> AsyncSlackNotifyAdapter:
+    """Build an adapter whose client is served by ``handler``."""
+    adapter = AsyncSlackNotifyAdapter(token="xoxb-test", http2=False, **kwargs)
+    adapter._client = httpx.AsyncClient(
+        base_url="https://slack.com/api/",
+        headers=adapter._client.headers,
+        transport=httpx.MockTransport(handler),
+    )
+    return adapter
+
+
+class TestAsyncSlackNotifyAdapter:
+    """Test suite for AsyncSlackNotifyAdapter."""
+
+    def test_init(self):
+        """Test adapter initialization."""
+        adapter = AsyncSlackNotifyAdapter(
+            token="xoxb-test", default_channel="#test", http2=False
+        )
+        assert adapter.token == "xoxb-test"
+        assert adapter.default_channel == "#test"
+        assert adapter._client.headers["Authorization"] == "Bearer xoxb-test"
+
+    def test_init_defaults(self):
+        """Test the default constructor builds an HTTP/2 client."""
+        pytest.importorskip("h2")
+        with patch.object(httpx, "AsyncClient", wraps=httpx.AsyncClient) as client_cls:
+            adapter = AsyncSlackNotifyAdapter(token="xoxb-test")
+
+        assert client_cls.call_args.kwargs["http2"] is True
+        asyncio.run(adapter.aclose())
+
+    def test_init_without_h2(self):
+        """Test HTTP/2 falls back to HTTP/1.1 when h2 is missing."""
+        with (
+            patch("herd_notify_slack.async_adapter.HAS_H2", False),
+            patch.object(httpx, "AsyncClient", wraps=httpx.AsyncClient) as client_cls,
+        ):
+            adapter = AsyncSlackNotifyAdapter(token="xoxb-test")
+
+        assert client_cls.call_args.kwargs["http2"] is False
+        asyncio.run(adapter.aclose())
+
+    def test_post_success(self):
+        """Test successful message posting."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(
+                200, json={"ok": True, "ts": "1234567890.123456", "channel": "C1"}
+            )
+
+        async def run():
+            async with _adapter(handler, default_channel="#default") as adapter:
+                return await adapter.post("Test message", username="TestBot")
+
+        result = asyncio.run(run())
+
+        assert result.message_id == "1234567890.123456"
+        assert result.channel == "C1"
+        assert str(requests[0].url) == "https://slack.com/api/chat.postMessage"
+        payload = json.loads(requests[0].content)
+        assert payload == {
+            "channel": "#default",
+            "text": "Test message",
+            "username": "TestBot",
+        }
+
+    def test_post_concurrent(self):
+        """Test posts can be fanned out with asyncio.gather."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            payload = json.loads(request.content)
+            return httpx.Response(
+                200, json={"ok": True, "ts": payload["text"], "channel": "C1"}
+            )
+
+        async def run():
+            async with _adapter(handler) as adapter:
+                return await asyncio.gather(
+                    *(adapter.post(str(i)) for i in range(5))
+                )
+
+        results = asyncio.run(run())
+
+        assert [r.message_id for r in results] == ["0", "1", "2", "3", "4"]
+
+    def test_post_error(self):
+        """Test posting with API error."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"ok": False, "error": "invalid_auth"})
+
+        async def run():
+            async with _adapter(handler) as adapter:
+                await adapter.post("Test message")
+
+        with pytest.raises(RuntimeError, match="invalid_auth"):
+            asyncio.run(run())
+
+    def test_http_error_handling(self):
+        """Test HTTP error handling."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(401)
+
+        async def run():
+            async with _adapter(handler) as adapter:
+                await adapter.post_thread("1.0", "Reply")
+
+        with pytest.raises(RuntimeError, match="HTTP error: 401"):
+            asyncio.run(run())
+
+    def test_get_thread_replies_success(self):
+        """Test fetching thread replies."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.params["channel"] == "C123456"
+            assert request.url.params["ts"] == "1.0"
+            return httpx.Response(
+                200,
+                json={
+                    "ok": True,
+                    "messages": [
+                        {"user": "U123", "text": "Parent", "ts": "1.0"},
+                        {"user": "U456", "text": "Reply", "ts": "1.1"},
+                    ],
+                },
+            )
+
+        async def run():
+            async with _adapter(handler) as adapter:
+                return await adapter.get_thread_replies("C123456", "1.0")
+
+        replies = asyncio.run(run())
+
+        assert len(replies) == 1
+        assert replies[0].author == "U456"
+
+    @staticmethod
+    def _search_handler(
+        total: int, pages: list[int]
+    ) -> Callable[[httpx.Request], httpx.Response]:
+        """Serve ``total`` matches in pages, recording the pages requested."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            count = int(request.url.params["count"])
+            page = int(request.url.params["page"])
+            pages.append(page)
+            start = (page - 1) * count
+            return httpx.Response(
+                200,
+                json={
+                    "ok": True,
+                    "messages": {
+                        "matches": [
+                            {"user": "U1", "text": str(i), "ts": f"{i}.0"}
+                            for i in range(start, min(start + count, total))
+                        ],
+                        "paging": {"total": total, "pages": -(-total // count)},
+                    },
+                },
+            )
+
+        return handler
+
+    def test_search_paginates(self):
+        """Test pages are fetched concurrently and merged in order."""
+        pages: list[int] = []
+
+        async def run():
+            async with _adapter(self._search_handler(1000, pages)) as adapter:
+                return await adapter.search("test query", limit=250)
+
+        results = asyncio.run(run())
+
+        assert [r.text for r in results] == [str(i) for i in range(250)]
+        assert sorted(pages) == [1, 2, 3]
+
+    def test_search_small_result_large_limit(self):
+        """Test only the pages Slack reports are requested."""
+        pages: list[int] = []
+
+        async def run():
+            async with _adapter(self._search_handler(1, pages)) as adapter:
+                return await adapter.search("test query", limit=1000)
+
+        results = asyncio.run(run())
+
+        assert len(results) == 1
+        assert pages == [1]
+
+    def test_search_malformed_paging(self):
+        """Test unusable paging info keeps the first page."""
+        pages: list[int] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            pages.append(int(request.url.params["page"]))
+            return httpx.Response(
+                200,
+                json={
+                    "ok": True,
+                    "messages": {
+                        "matches": [
+                            {"user": "U1", "text": str(i), "ts": f"{i}.0"}
+                            for i in range(100)
+                        ],
+                        "paging": {"total": None},
+                    },
+                },
+            )
+
+        async def run():
+            async with _adapter(handler) as adapter:
+                return await adapter.search("test query", limit=200)
+
+        results = asyncio.run(run())
+
+        assert len(results) == 100
+        assert pages == [1]
+
+    def test_search_error(self):
+        """Test search swallows errors."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(500)
+
+        async def run():
+            async with _adapter(handler, max_retries=0) as adapter:
+                return await adapter.search("test query")
+
+        assert asyncio.run(run()) == []
+
+    def test_retries_rate_limited(self):
+        """Test 429 is retried after Retry-After."""
+        responses = [
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(200, json={"ok": True, "ts": "1.0", "channel": "C1"}),
+        ]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return responses.pop(0)
+
+        async def run():
+            async with _adapter(handler) as adapter:
+                result = await adapter.post("Test message")
+                return adapter, result
+
+        adapter, result = asyncio.run(run())
+
+        assert result.message_id == "1.0"
+        assert responses == []
+        assert adapter._buckets[("chat.postMessage", "#herd-feed")].rate < 1.0